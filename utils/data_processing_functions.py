@@ -1,8 +1,118 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# Número máximo de linhas exibidas nos resumos impressos
+MAX_ROWS_DISPLAYED = 50
+
+# Funções Auxiliares
+def _quartile_positions(size):
+    """
+    Calcula as posições usadas na interpolação linear dos quartis de um array ordenado.
+
+    Parâmetros:
+        size (int): O número de valores do array.
+
+    Retorna:
+        tuple: Os índices inferiores, os índices superiores e os pesos da interpolação
+        de Q1, mediana e Q3.
+    """
+    positions = np.array([0.25, 0.5, 0.75]) * (size - 1)
+    lower = np.floor(positions).astype(int)
+    upper = np.ceil(positions).astype(int)
+    
+    return lower, upper, positions - lower
+
+
+def _iqr_stats(values):
+    """
+    Calcula o primeiro quartil, a mediana e o terceiro quartil de um array numérico.
+
+    Os valores nulos são ignorados e os quartis são obtidos com um particionamento
+    parcial (np.partition) em torno das posições necessárias, sem ordenar o array
+    inteiro, com a mesma interpolação linear usada por pd.Series.quantile.
+
+    Parâmetros:
+        values (np.ndarray): O array com os valores da coluna.
+
+    Retorna:
+        tuple: Uma tupla (Q1, mediana, Q3), com NaN se não houver valores não nulos.
+    """
+    partitioned = values[~np.isnan(values)].astype(float)
+    if partitioned.size == 0:
+        return (np.nan, np.nan, np.nan)
+    
+    lower, upper, weights = _quartile_positions(partitioned.size)
+    partitioned.partition(np.unique(np.concatenate([lower, upper])))
+    quartiles = partitioned[lower] + (partitioned[upper] - partitioned[lower]) * weights
+    
+    return tuple(quartiles)
+
+
+def _count_missing(df):
+    """
+    Conta os valores nulos de cada coluna de um DataFrame.
+
+    Para colunas com backend Arrow (como as de um DataFrame preparado com
+    prepare()), a contagem é lida dos metadados de cada array Arrow, sem percorrer
+    os dados. As demais colunas são contadas por uma única redução sobre a matriz
+    booleana de isna().
+
+    Parâmetros:
+        df (pd.DataFrame): O DataFrame a ser analisado.
+
+    Retorna:
+        np.ndarray: O número de valores nulos de cada coluna, na ordem de df.columns.
+    """
+    is_arrow = np.array([isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes], dtype=bool)
+    missing_data = np.zeros(df.shape[1], dtype=np.int64)
+    
+    if is_arrow.any():
+        missing_data[is_arrow] = [pa.array(df.iloc[:, i]).null_count for i in np.flatnonzero(is_arrow)]
+    if not is_arrow.all():
+        missing_data[~is_arrow] = df.iloc[:, ~is_arrow].isna().to_numpy().sum(axis=0)
+    
+    return missing_data
+
+# Funções de Preparação
+def prepare(df):
+    """
+    Converte as colunas de um DataFrame para tipos com backend Arrow (pyarrow).
+
+    Cada coluna é convertida separadamente: colunas inteiras passam a int64[pyarrow],
+    colunas de texto a string[pyarrow] e colunas float a double[pyarrow]. As colunas
+    float não são convertidas para inteiros, mesmo quando contêm apenas números
+    inteiros e nulos, para que a mediana usada nos tratamentos não seja truncada.
+
+    Com um DataFrame preparado, apenas a contagem de nulos (check_missing_values)
+    e o value_counts (create_frequency_table e plot_categorical) aproveitam o
+    backend Arrow. check_outliers_column e treat_outliers_column_median convertem
+    a coluna para um array NumPy float antes de calcular os quartis, e
+    treat_outliers_column_median grava a coluna tratada como float64 NumPy,
+    descartando o tipo Arrow original.
+
+    Parâmetros:
+        df (pd.DataFrame): O DataFrame a ser convertido.
+
+    Retorna:
+        pd.DataFrame: Um novo DataFrame com tipos Arrow; o original não é modificado.
+    """
+    if df.shape[1] == 0:
+        return df.copy()
+    
+    return pd.concat(
+        [
+            series.convert_dtypes(
+                dtype_backend='pyarrow',
+                convert_integer=not pd.api.types.is_float_dtype(series.dtype),
+            )
+            for _, series in df.items()
+        ],
+        axis=1,
+    )
+
 # Funções de Verificação
 def check_missing_values(df):
     """
@@ -15,21 +125,28 @@ def check_missing_values(df):
         None: A função imprime o resultado diretamente.
     """
     print(" ============== Resumo de Valores Nulos ============== ")
-    missing_data = df.isnull().sum()
+    missing_data = _count_missing(df)
+    
+    if missing_data.sum() == 0:
+        print("Não há valores nulos neste DataFrame.")
+        print("\nTotal de colunas com valores nulos:", 0)
+        return
+    
+    has_missing = missing_data > 0
+    missing_data = missing_data[has_missing]
     missing_percentage = (missing_data / len(df)) * 100
     missing_summary = pd.DataFrame({
-        'Coluna': df.columns,
+        'Coluna': df.columns[has_missing],
         'Valores Nulos': missing_data,
         'Porcentagem (%)': missing_percentage.round(2)
     })
-    missing_summary = missing_summary[missing_summary['Valores Nulos'] > 0].reset_index(drop=True)
     
-    if missing_summary.empty:
-        print("Não há valores nulos neste DataFrame.")
-    else:
-        print(missing_summary.to_string(index=False))
+    num_missing_columns = len(missing_summary)
+    print(missing_summary.head(MAX_ROWS_DISPLAYED).to_string(index=False))
+    if num_missing_columns > MAX_ROWS_DISPLAYED:
+        print(f"... ({num_missing_columns - MAX_ROWS_DISPLAYED} colunas a mais)")
 
-    print("\nTotal de colunas com valores nulos:", len(missing_summary))
+    print("\nTotal de colunas com valores nulos:", num_missing_columns)
 
 def check_outliers_column(df, column, factor=1.5):
     """
@@ -41,25 +158,39 @@ def check_outliers_column(df, column, factor=1.5):
         factor (float, opcional): O fator multiplicador do IQR para definir os limites dos outliers (padrão: 1.5).
 
     Retorna:
-        dict: Dicionário contendo informações sobre os outliers.
+        dict: Dicionário contendo informações sobre os outliers. As chaves 'Q1', 'median'
+        e 'Q3' podem ser repassadas a treat_outliers_column_median pelo argumento stats,
+        evitando recalcular os quartis da mesma coluna.
     """
     print(f" ============== Resumo de Outliers: {column} ============== ")
     
-    Q1 = df[column].quantile(0.25)
-    Q3 = df[column].quantile(0.75)
+    series = df[column]
+    column_values = series.to_numpy(dtype=float, na_value=np.nan)
+    Q1, median, Q3 = _iqr_stats(column_values)
     IQR = Q3 - Q1
     lower_bound = max(0, Q1 - factor * IQR)
     upper_bound = Q3 + factor * IQR
     
-    outliers = df[(df[column] < lower_bound) | (df[column] > upper_bound)][column]
+    mask = (column_values < lower_bound) | (column_values > upper_bound)
+    outliers = column_values[mask]
     
     total_rows = len(df)
-    num_outliers = len(outliers)
+    num_outliers = outliers.size
     percentage_outliers = (num_outliers / total_rows) * 100
     
+    outliers_info = {
+        'Q1': Q1,
+        'median': median,
+        'Q3': Q3,
+        'lower_bound': lower_bound,
+        'upper_bound': upper_bound,
+        'num_outliers': num_outliers,
+        'percentage_outliers': percentage_outliers,
+    }
+    
     if num_outliers == 0:
         print("Não há outliers nesta coluna.")
-        return None
+        return outliers_info
     
     print(f"Limite inferior: {lower_bound:.2f}")
     print(f"Limite superior: {upper_bound:.2f}")
@@ -67,12 +198,25 @@ def check_outliers_column(df, column, factor=1.5):
     print(f"Porcentagem de outliers: {percentage_outliers:.2f}%")
     
     print("\nResumo estatístico dos outliers:")
-    print(outliers.describe())
+    # Uma única ordenação fornece mínimo, quartis e máximo
+    outliers.sort()
+    lower, upper, weights = _quartile_positions(num_outliers)
+    quartiles = outliers[lower] + (outliers[upper] - outliers[lower]) * weights
+    stats = (
+        num_outliers,
+        outliers.mean(),
+        outliers.std(ddof=1) if num_outliers > 1 else np.nan,
+        outliers[0],
+        *quartiles,
+        outliers[-1],
+    )
+    for label, value in zip(['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'], stats):
+        print(f"{label:<6}{value:>16.6f}")
     
     print("\nPrimeiros 10 valores outliers:")
-    print(outliers.head(10).tolist())
+    print(series.iloc[np.flatnonzero(mask)[:10]].tolist())
     
-    return
+    return outliers_info
 
 # Funções de Tratamento
 def treat_missing_values_column_median(df, column):
@@ -93,14 +237,15 @@ def treat_missing_values_column_median(df, column):
         - Modifica o DataFrame original, substituindo valores ausentes pela mediana.
         - Imprime uma mensagem confirmando o tratamento dos valores ausentes.
     """
-    median = df[column].median()
-    df[column] = df[column].fillna(median)
+    series = df[column]
+    median = series.median()
+    df[column] = series.fillna(median)
     print(f"Valores ausentes na coluna '{column}' foram tratados com sucesso usando a mediana ({median}).")
     
     return
 
 
-def treat_outliers_column_median(df, column):
+def treat_outliers_column_median(df, column, stats=None):
     """
     Trata outliers em uma coluna de um DataFrame substituindo-os pela mediana.
 
@@ -110,6 +255,11 @@ def treat_outliers_column_median(df, column):
     Parâmetros:
         df (pd.DataFrame): O DataFrame a ser tratado.
         column (str): O nome da coluna em que serão tratados os outliers.
+        stats (dict, opcional): Quartis já calculados para a coluna, como o dicionário
+            retornado por check_outliers_column (chaves 'Q1', 'median' e 'Q3'). Se não
+            informado, os quartis são calculados a partir da coluna. Os quartis não são
+            recalculados: se a coluna foi alterada depois de calculá-los (por exemplo,
+            pelo tratamento de valores ausentes), eles estarão desatualizados.
 
     Retorna:
         None: A função modifica o DataFrame in-place e não retorna nenhum valor.
@@ -118,14 +268,18 @@ def treat_outliers_column_median(df, column):
         - Modifica o DataFrame original, substituindo outliers pela mediana.
         - Imprime uma mensagem confirmando o tratamento dos outliers.
     """
-    Q1 = df[column].quantile(0.25)
-    Q3 = df[column].quantile(0.75)
+    column_values = df[column].to_numpy(dtype=float, na_value=np.nan, copy=True)
+    if stats is None:
+        Q1, median, Q3 = _iqr_stats(column_values)
+    else:
+        Q1, median, Q3 = stats['Q1'], stats['median'], stats['Q3']
     IQR = Q3 - Q1
     lower_bound = Q1 - 1.5 * IQR
     upper_bound = Q3 + 1.5 * IQR
     
-    median = df[column].median()
-    df[column] = np.where((df[column] < lower_bound) | (df[column] > upper_bound), median, df[column])
+    mask = (column_values < lower_bound) | (column_values > upper_bound)
+    column_values[mask] = median
+    df[column] = column_values
     print(f"Outliers na coluna '{column}' foram tratados com sucesso usando a mediana ({median}).")
     
     return
@@ -151,12 +305,10 @@ def create_frequency_table(df, column_name):
           para cada valor único na coluna especificada.
     """
     counts = df[column_name].value_counts()
-    percentages = df[column_name].value_counts(normalize=True).mul(100).round(2)
-    
-    result = pd.concat([counts, percentages], axis=1, keys=['Contagem', 'Porcentagem'])
-    result['Porcentagem'] = result['Porcentagem'].astype(str) + '%'
+    percentages = counts.div(counts.sum()).mul(100).round(2).astype(str) + '%'
     
-    result = result.sort_values('Contagem', ascending=False)
+    # value_counts já retorna as contagens em ordem decrescente
+    result = pd.concat([counts.rename('Contagem'), percentages.rename('Porcentagem')], axis=1)
     
     print(f"\nDistribuição de {column_name}:")
     print(result)
@@ -196,14 +348,10 @@ def plot_categorical(df, column):
     plt.ylabel('Contagem')
     
     total = len(df)
-    for i, p in enumerate(ax.patches):
-        height = p.get_height()
-        percentage = f'{100 * height / total:.1f}%'
-        label = f'{int(height)}\n({percentage})'
-        ax.text(p.get_x() + p.get_width()/2, height, 
-                label, 
-                ha='center', va='bottom',
-                rotation=0)
+    heights = value_counts.to_numpy()
+    percentages = 100 * heights / total
+    labels = [f'{height}\n({percentage:.1f}%)' for height, percentage in zip(heights, percentages)]
+    ax.bar_label(ax.containers[0], labels=labels, padding=2)
     
     plt.tight_layout()
     plt.show()